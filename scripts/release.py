@@ -34,80 +34,220 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
+import os
 import re
-import subprocess
 import sys
-from datetime import datetime, timezone
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+# subprocess and datetime are imported where they are used so that --help and
+# early validation failures don't pay for them
+if TYPE_CHECKING:
+    import subprocess
 
 # File paths relative to project root
 PROJECT_ROOT = Path(__file__).parent.parent
 VERSION_FILES = [
     "pyproject.toml",
-    "src/plottini/__init__.py",
+    "src/plottini/_version.py",
     "tests/test_basic.py",
     "tests/test_cli.py",
     "uv.lock",
 ]
+# Resolved once so the update and staging loops don't repeat the joins
+VERSION_PATHS: tuple[Path, ...] = tuple(PROJECT_ROOT / f for f in VERSION_FILES)
 CHANGELOG_FILE = PROJECT_ROOT / "CHANGELOG.md"
 
-# CalVer pattern: YYYY.M.MICRO (with optional .devN suffix)
-# Accepts 1-2 digit months for flexibility (e.g., 2026.2.0 or 2026.02.0)
-CALVER_PATTERN = re.compile(r"^(\d{4})\.(\d{1,2})\.(\d+)(?:\.dev\d+)?$")
+# Number of recent commits used for the changelog when there is no version tag
+FALLBACK_COMMIT_COUNT = 50
+# Upper bound on commits read for one changelog section; keeps the git log
+# walk bounded when the last tag is far back in a long history
+MAX_COMMITS = 500
+
+# CalVer versions are YYYY.M.MICRO (with optional .devN suffix); see _parse_calver.
+# 1-2 digit months are accepted for flexibility (e.g., 2026.2.0 or 2026.02.0)
+DEV_SUFFIX_RE = re.compile(r"\.dev\d+$")
+
+# Precompiled patterns for version files and changelog generation
+# Anchored on the preceding newline rather than ^ + re.MULTILINE; neither file
+# starts with its version line
+# Version file patterns work on bytes: the files are rewritten without decoding
+PYPROJECT_VERSION_RE = re.compile(rb'\nversion = "[^"]+"')
+VERSION_MODULE_RE = re.compile(rb'\n__version__ = "[^"]+"')
+TEST_BASIC_VERSION_RE = re.compile(rb'__version__ == "[^"]+"')
+TEST_CLI_VERSION_RE = re.compile(rb"Plottini version [0-9]+\.[0-9]+\.[0-9]+(?:\.dev[0-9]+)?")
+# The separator is captured (and written back) so CRLF checkouts still match
+UVLOCK_VERSION_RE = re.compile(rb'(name = "plottini"\r?\nversion = ")[^"]+(")')
+CONV_COMMIT_RE = re.compile(r"^(\w+)(?:\(([^)]+)\))?(!)?\s*:\s*(.+)$")
+# Conventional Commits footer; BREAKING-CHANGE is an accepted synonym
+BREAKING_CHANGE_RE = re.compile(r"^BREAKING[ -]CHANGE:\s", re.MULTILINE)
+
+
+class Commit(NamedTuple):
+    """A commit considered for the changelog."""
+
+    subject: str
+    body: str
+    sha: str
+
+
+class CalVer(NamedTuple):
+    """A parsed YYYY.M.MICRO version."""
+
+    year: int
+    month: int
+    micro: int
+
+    def __str__(self) -> str:
+        # PEP 440 compliant (no zero-padding)
+        return f"{self.year}.{self.month}.{self.micro}"
+
+
+@functools.lru_cache(maxsize=1)
+def _git_env() -> dict[str, str] | None:
+    """Environment for child processes that points git straight at the repo.
+
+    With GIT_DIR and GIT_WORK_TREE set, git skips its upward search for the
+    repository on every invocation. Returns None (inherit the environment)
+    when .git is not a directory, e.g. in a linked worktree.
+    """
+    git_dir = PROJECT_ROOT / ".git"
+    if not git_dir.is_dir():
+        return None
+    return {**os.environ, "GIT_DIR": str(git_dir), "GIT_WORK_TREE": str(PROJECT_ROOT)}
+
+
+def run_command(
+    cmd: list[str], check: bool = True, capture: bool = True
+) -> subprocess.CompletedProcess[str]:
+    """Run a shell command and return the result.
+
+    Pass ``capture=False`` for side-effect-only commands whose output is never
+    read; their output then goes straight to the terminal.
+    """
+    import subprocess
+
+    if capture:
+        return subprocess.run(
+            cmd, capture_output=True, text=True, check=check, cwd=PROJECT_ROOT, env=_git_env()
+        )
+    # Status lines stay in Python's stdout buffer (block-buffered when piped,
+    # e.g. in CI) until here, so they are written out in one go and still
+    # land ahead of the command's own output
+    sys.stdout.flush()
+    return subprocess.run(cmd, text=True, check=check, cwd=PROJECT_ROOT, env=_git_env())
+
 
+def _check_cmd(cmd: list[str]) -> bool:
+    """Run a command only for its exit status; return True if it succeeded.
 
-def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess[str]:
-    """Run a shell command and return the result."""
-    return subprocess.run(cmd, capture_output=True, text=True, check=check, cwd=PROJECT_ROOT)
+    Output is discarded rather than captured, and a missing executable
+    counts as failure.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=PROJECT_ROOT,
+            env=_git_env(),
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str:
-    """Read current version from pyproject.toml."""
+    """Read current version from pyproject.toml.
+
+    The result is cached for the life of the process; it reflects the version
+    the run started from, not any later rewrite by update_all_version_files.
+    """
     pyproject = PROJECT_ROOT / "pyproject.toml"
-    content = pyproject.read_text()
-    match = re.search(r'^version = "([^"]+)"', content, re.MULTILINE)
-    if not match:
-        print("Error: Could not find version in pyproject.toml")
-        sys.exit(1)
-    return match.group(1)
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        with open(pyproject, "rb") as f:
+            data = tomllib.load(f)
+        try:
+            version = data["project"]["version"]
+        except KeyError:
+            pass
+        else:
+            if isinstance(version, str):
+                return version
+
+    # No tomllib (Python 3.10) or no [project] version: scan for the version line
+    for line in pyproject.read_text().splitlines():
+        if line.startswith('version = "'):
+            return line.split('"', 2)[1]
+    print("Error: Could not find version in pyproject.toml")
+    sys.exit(1)
 
 
 def strip_dev_suffix(version: str) -> str:
     """Strip .devN suffix from version string."""
-    return re.sub(r"\.dev\d+$", "", version)
+    return DEV_SUFFIX_RE.sub("", version)
 
 
-def validate_calver(version: str) -> str:
+def _parse_calver(version: str) -> CalVer | None:
+    """Parse a YYYY.M.MICRO version (optional .devN suffix) into integers.
+
+    Accepts the same strings as CalVer format YYYY.M(M).MICRO; the month
+    range is not checked here.
+
+    Returns:
+        The parsed CalVer, or None if the string is not CalVer
+    """
+    parts = version.split(".")
+    if len(parts) == 4:
+        # Optional .devN suffix, checked here rather than with DEV_SUFFIX_RE
+        dev = parts.pop()
+        if not (dev.startswith("dev") and dev[3:].isdecimal()):
+            return None
+    if len(parts) != 3:
+        return None
+    year, month, micro = parts
+    if len(year) != 4 or not 1 <= len(month) <= 2 or not micro:
+        return None
+    if not (year.isdecimal() and month.isdecimal() and micro.isdecimal()):
+        return None
+    return CalVer(int(year), int(month), int(micro))
+
+
+def validate_calver(version: str) -> tuple[str, CalVer]:
     """Validate and normalize CalVer version string.
 
     Args:
         version: Version string to validate (e.g., "2026.2.0" or "2026.02.0")
 
     Returns:
-        PEP 440 compliant version (no zero-padding), without .dev suffix
+        Tuple of (PEP 440 compliant version (no zero-padding) without .dev
+        suffix, parsed CalVer)
 
     Raises:
         SystemExit: If version format is invalid
     """
-    normalized = strip_dev_suffix(version)
-
-    match = CALVER_PATTERN.match(normalized)
-    if not match:
+    parsed = _parse_calver(version)
+    if parsed is None:
         print(f"Error: Invalid CalVer format: {version}")
         print("Version must be in YYYY.M.MICRO format (e.g., 2026.2.0)")
         sys.exit(1)
 
-    year_str, month_str, micro_str = match.groups()
-    month_int = int(month_str)
-    micro_int = int(micro_str)
-
-    if not (1 <= month_int <= 12):
+    if not (1 <= parsed.month <= 12):
         print(f"Error: Invalid CalVer month: {version}")
         print("Month component must be between 1 and 12.")
         sys.exit(1)
 
     # Return PEP 440 compliant version (no zero-padding)
-    return f"{year_str}.{month_int}.{micro_int}"
+    return str(parsed), parsed
 
 
 def calculate_next_version(current: str, force_micro: bool = False) -> str:
@@ -120,243 +260,361 @@ def calculate_next_version(current: str, force_micro: bool = False) -> str:
     Returns:
         Next version in YYYY.M.MICRO format (PEP 440 compliant)
     """
-    # Strip any .dev suffix from current version
-    base_version = strip_dev_suffix(current)
-
-    # Parse current version
-    match = CALVER_PATTERN.match(base_version)
-    if not match:
-        # If current version isn't CalVer, start fresh with current date
-        now = datetime.now(timezone.utc)
-        return f"{now.year}.{now.month}.0"
+    from datetime import datetime, timezone
 
-    current_year = int(match.group(1))
-    current_month = int(match.group(2))
-    current_micro = int(match.group(3))
-
-    # Get current date
     now = datetime.now(timezone.utc)
-    target_year = now.year
-    target_month = now.month
 
-    if force_micro or (target_year == current_year and target_month == current_month):
+    # Parse current version (any .dev suffix is ignored)
+    parsed = _parse_calver(current)
+    if parsed is not None and (
+        force_micro or (now.year == parsed.year and now.month == parsed.month)
+    ):
         # Same year.month: increment micro
-        return f"{current_year}.{current_month}.{current_micro + 1}"
-    else:
-        # New month: reset micro to 0
-        return f"{target_year}.{target_month}.0"
+        return str(parsed._replace(micro=parsed.micro + 1))
+
+    # New month, or current version isn't CalVer: start fresh with current date
+    return str(CalVer(now.year, now.month, 0))
 
 
-def calculate_dev_version(release_version: str) -> str:
+def calculate_dev_version(release_version: str, parsed: CalVer | None = None) -> str:
     """Calculate the dev version to set after a release.
 
     After releasing 2026.2.0, set version to 2026.2.1.dev0
+
+    Args:
+        release_version: The release version
+        parsed: CalVer already parsed from release_version, if available;
+            skips parsing it again
     """
-    match = CALVER_PATTERN.match(release_version)
-    if not match:
+    if parsed is None:
+        parsed = _parse_calver(release_version)
+    if parsed is None:
         print(f"Error: Invalid release version: {release_version}")
         sys.exit(1)
 
-    year = int(match.group(1))
-    month = int(match.group(2))
-    micro = int(match.group(3))
+    return f"{parsed._replace(micro=parsed.micro + 1)}.dev0"
 
-    return f"{year}.{month}.{micro + 1}.dev0"
+
+def _write_atomic(path: Path, *chunks: bytes | memoryview) -> None:
+    """Replace a file's contents atomically with the concatenation of ``chunks``.
+
+    The chunks go to a sibling temporary file that is then renamed over
+    ``path``, so an interrupted release never leaves a half-written file.
+    Writing them one by one means callers never build the joined contents.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Version patterns and replacement templates keyed by file name
+VERSION_PATTERNS: dict[str, tuple[re.Pattern[bytes], str]] = {
+    "pyproject.toml": (PYPROJECT_VERSION_RE, '\nversion = "{v}"'),
+    "_version.py": (VERSION_MODULE_RE, '\n__version__ = "{v}"'),
+    # Match any version format for replacement
+    "test_basic.py": (TEST_BASIC_VERSION_RE, '__version__ == "{v}"'),
+    # Match version number only (not the closing quote)
+    "test_cli.py": (TEST_CLI_VERSION_RE, "Plottini version {v}"),
+    # Match the plottini package version line
+    "uv.lock": (UVLOCK_VERSION_RE, r"\g<1>{v}\g<2>"),
+}
 
 
 def update_version_file(filepath: Path, old_version: str, new_version: str) -> bool:
     """Update version in a single file."""
-    if not filepath.exists():
+    if old_version == new_version:
+        # Nothing to change; leave the file (and its mtime) untouched
+        return False
+
+    entry = VERSION_PATTERNS.get(filepath.name)
+    if entry is None:
+        return False
+
+    try:
+        content = filepath.read_bytes()
+    except FileNotFoundError:
         print(f"  Warning: File not found: {filepath}")
         return False
 
-    content = filepath.read_text()
-    # Create replacement pattern based on the file type
-    if "pyproject.toml" in str(filepath):
-        new_content = re.sub(
-            r'^version = "[^"]+"', f'version = "{new_version}"', content, flags=re.MULTILINE
-        )
-    elif "__init__.py" in str(filepath):
-        new_content = re.sub(
-            r'^__version__ = "[^"]+"',
-            f'__version__ = "{new_version}"',
-            content,
-            flags=re.MULTILINE,
-        )
-    elif "test_basic.py" in str(filepath):
-        # Match any version format for replacement
-        new_content = re.sub(
-            r'__version__ == "[^"]+"',
-            f'__version__ == "{new_version}"',
-            content,
-        )
-    elif "test_cli.py" in str(filepath):
-        # Match version number only (not the closing quote)
-        new_content = re.sub(
-            r"Plottini version [0-9]+\.[0-9]+\.[0-9]+(?:\.dev[0-9]+)?",
-            f"Plottini version {new_version}",
-            content,
-        )
-    elif "uv.lock" in str(filepath):
-        # Match the plottini package version line
-        new_content = re.sub(
-            r'(name = "plottini"\nversion = ")[^"]+(")',
-            rf"\g<1>{new_version}\g<2>",
-            content,
-        )
-    else:
+    # Already at the target version (e.g. a re-run after a failed push)
+    old_bytes, new_bytes = old_version.encode(), new_version.encode()
+    if old_bytes not in content and new_bytes in content:
         return False
 
-    if new_content != content:
-        filepath.write_text(new_content)
-        return True
-    return False
+    pattern, template = entry
+    # subn reports whether anything matched, so the contents needn't be compared
+    new_content, count = pattern.subn(template.format(v=new_version).encode(), content)
+    if not count:
+        return False
+    _write_atomic(filepath, new_content)
+    return True
 
 
-def update_all_version_files(old_version: str, new_version: str) -> None:
-    """Update version in all tracked files."""
+def update_all_version_files(old_version: str, new_version: str) -> list[Path]:
+    """Update version in all tracked files.
+
+    Returns:
+        The files that were rewritten, in VERSION_FILES order
+    """
     print("\nUpdating files...")
-    for filepath in VERSION_FILES:
-        full_path = PROJECT_ROOT / filepath
-        if update_version_file(full_path, old_version, new_version):
+    # The files are independent, so overlap their reads and writes
+    with ThreadPoolExecutor(max_workers=len(VERSION_FILES)) as executor:
+        results = list(
+            executor.map(
+                lambda path: update_version_file(path, old_version, new_version),
+                VERSION_PATHS,
+            )
+        )
+
+    # Report in VERSION_FILES order to keep output deterministic
+    updated_paths: list[Path] = []
+    for filepath, path, updated in zip(VERSION_FILES, VERSION_PATHS, results, strict=True):
+        if updated:
             print(f"  ✓ {filepath}")
+            updated_paths.append(path)
         else:
             print(f"  ✗ {filepath} (no changes or not found)")
+    return updated_paths
 
 
-def get_commits_since_tag(tag: str) -> list[dict[str, str]]:
-    """Get commits since the specified tag.
+def _stream_fields(log_args: list[str]) -> Generator[str, None, int]:
+    """Stream NUL-separated git log fields as git produces them.
 
-    Uses full commit message (subject + body) to detect BREAKING CHANGE markers.
+    git log runs with ``-z``, so commits are separated by NUL; ``log_args``
+    must supply a ``--pretty`` format that separates its fields with
+    ``%x00`` as well. Returns the git exit code once the output has been
+    consumed.
+    """
+    import subprocess
+
+    proc = subprocess.Popen(
+        ["git", "log", "-z", *log_args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=_git_env(),
+    )
+    stdout = proc.stdout
+    assert stdout is not None
+    with proc:
+        buffer = ""
+        received = False
+        for chunk in iter(lambda: stdout.read(8192), ""):
+            received = True
+            buffer += chunk
+            # Keep the trailing partial field for the next chunk
+            *fields, buffer = buffer.split("\x00")
+            yield from fields
+        if received:
+            yield buffer
+    return proc.returncode
+
+
+def get_tag_and_commits() -> tuple[str | None, list[Commit], bool]:
+    """Get the most recent version tag and the commits made since it.
+
+    The tag comes from ``git describe``; the commits are then streamed from
+    ``git log <tag>..HEAD``, so commits merged in after the tag are listed
+    even when their committer date is older than the tag. git splits each
+    message into subject and body; the body is kept to detect BREAKING
+    CHANGE markers. Merge commits are skipped.
+
+    At most MAX_COMMITS commits are read after a tag, or the latest
+    FALLBACK_COMMIT_COUNT when there is no version tag. If more commits
+    remain, reading stops and the result is marked truncated; the changelog
+    then notes that only the latest commits are listed.
+
+    Returns:
+        (tag, commits, truncated). tag is None if there is no version tag;
+        truncated is True if older commits were left out.
     """
+    result = run_command(["git", "describe", "--tags", "--abbrev=0", "--match", "v*"], check=False)
+    tag = result.stdout.strip() if result.returncode == 0 else None
+    limit = MAX_COMMITS if tag is not None else FALLBACK_COMMIT_COUNT
+
+    commits: list[Commit] = []
+    # %h is the short SHA, %s the subject and %b the body
+    fields = _stream_fields(
+        [
+            f"{tag}..HEAD" if tag is not None else "HEAD",
+            "--no-merges",
+            "--pretty=format:%h%x00%s%x00%b",
+        ]
+    )
     try:
-        # Use %B for full message, %h for short SHA, with explicit separators
-        # %x1f is unit separator, %x1e is record separator
-        result = run_command(
-            [
-                "git",
-                "log",
-                f"{tag}..HEAD",
-                "--pretty=format:%B%x1f%h%x1e",
-                "--no-merges",
-            ],
-            check=False,
-        )
-        if result.returncode != 0:
-            # Tag might not exist, get recent commits
-            result = run_command(
-                [
-                    "git",
-                    "log",
-                    "-50",
-                    "--pretty=format:%B%x1f%h%x1e",
-                    "--no-merges",
-                ],
-                check=False,
-            )
-    except Exception:
-        return []
-
-    commits: list[dict[str, str]] = []
-    output = result.stdout
-    if not output:
-        return commits
-
-    # Split by record separator (\x1e) to get each commit entry
-    for entry in output.strip().split("\x1e"):
-        if not entry.strip():
-            continue
-        # Each entry is "full_message<US>sha" where <US> is \x1f
-        if "\x1f" not in entry:
-            continue
-        message, sha = entry.rsplit("\x1f", 1)
-        commits.append({"message": message.strip(), "sha": sha.strip()})
-    return commits
-
-
-def parse_conventional_commit(full_message: str) -> tuple[str | None, str | None, bool, str]:
+        # Every commit contributes exactly three fields
+        for sha, subject, body in zip(fields, fields, fields, strict=False):
+            if len(commits) == limit:
+                # Stop reading; closing the pipe ends the git process early
+                fields.close()
+                return tag, commits, True
+            commits.append(Commit(subject.strip(), body.strip(), sha))
+    except OSError:
+        return tag, [], False
+
+    return tag, commits, False
+
+
+def _parse_conventional_head(subject: str) -> tuple[str, str | None, bool] | None:
+    """Parse the "type(scope)!" head of a subject using string methods only.
+
+    Handles the common shapes of conventional commit subjects. Returns None
+    when the subject needs the full CONV_COMMIT_RE match to decide.
+    """
+    head, sep, description = subject.partition(":")
+    if not sep or not description.strip():
+        return None
+
+    head = head.rstrip()
+    breaking = head.endswith("!")
+    if breaking:
+        head = head[:-1]
+
+    scope: str | None = None
+    if head.endswith(")"):
+        head, paren, scope = head[:-1].partition("(")
+        if not paren or not scope or ")" in scope:
+            return None
+
+    # Conservative subset of \w+; anything else goes through the regex
+    if not (head.isascii() and head.replace("_", "a").isalnum()):
+        return None
+    return head, scope, breaking
+
+
+def parse_conventional_commit(
+    subject: str, body: str = ""
+) -> tuple[str | None, str | None, bool, str]:
     """Parse a conventional commit message.
 
     Args:
-        full_message: Full commit message (subject + body)
+        subject: Commit subject line
+        body: Commit body, searched for a BREAKING CHANGE footer
 
     Returns: (type, scope, is_breaking, subject_line)
     """
-    # Get subject line (first line of message)
-    subject = full_message.split("\n")[0].strip()
+    subject = subject.strip()
+    if ":" not in subject:
+        # Every conventional header has a colon; skip both parsers
+        return None, None, False, subject
 
     # Pattern: type(scope)!: description or type!: description or type: description
-    pattern = r"^(\w+)(?:\(([^)]+)\))?(!)?\s*:\s*(.+)$"
-    match = re.match(pattern, subject)
-    if match:
-        commit_type, scope, breaking, description = match.groups()
-        # Check for breaking change in subject (!) or body (BREAKING CHANGE:)
-        is_breaking = breaking == "!" or "BREAKING CHANGE" in full_message
-        return commit_type, scope, is_breaking, subject
-    return None, None, False, subject
-
-
-def generate_changelog_section(version: str, commits: list[dict[str, str]]) -> str:
-    """Generate changelog section from commits."""
+    parsed = _parse_conventional_head(subject)
+    if parsed is None:
+        match = CONV_COMMIT_RE.match(subject)
+        if not match:
+            return None, None, False, subject
+        commit_type, scope, bang, _description = match.groups()
+        parsed = (commit_type, scope, bang == "!")
+
+    commit_type, scope, breaking = parsed
+    # Check for breaking change in subject (!) or a BREAKING CHANGE: footer;
+    # the substring test keeps the regex off messages that can't match
+    is_breaking = breaking or ("BREAKING" in body and BREAKING_CHANGE_RE.search(body) is not None)
+    return commit_type, scope, is_breaking, subject
+
+
+def generate_changelog_section(version: str, commits: list[Commit], truncated: bool = False) -> str:
+    """Generate changelog section from commits.
+
+    If ``truncated`` is set, a closing note says that older commits were
+    left out.
+    """
+    from datetime import datetime, timezone
+
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    sections: dict[str, list[str]] = {
-        "Breaking Changes": [],
-        "Features": [],
-        "Fixes": [],
-        "Other": [],
-    }
+    breaking: list[str] = []
+    features: list[str] = []
+    fixes: list[str] = []
+    other: list[str] = []
+
+    # Bind the append methods once instead of looking them up per commit
+    add_breaking = breaking.append
+    add_feature = features.append
+    add_fix = fixes.append
+    add_other = other.append
 
     for commit in commits:
-        commit_type, scope, is_breaking, subject = parse_conventional_commit(commit["message"])
+        commit_type, _scope, is_breaking, subject = parse_conventional_commit(
+            commit.subject, commit.body
+        )
 
-        # Determine category
+        # Use commit subject line as changelog entry
+        entry = f"- {subject}"
         if is_breaking:
-            category = "Breaking Changes"
+            add_breaking(entry)
         elif commit_type == "feat":
-            category = "Features"
+            add_feature(entry)
         elif commit_type == "fix":
-            category = "Fixes"
+            add_fix(entry)
         else:
-            category = "Other"
-
-        # Use commit subject line as changelog entry
-        sections[category].append(f"- {subject}")
-
-    # Build changelog section
-    lines = [f"## [{version}] - {today}", ""]
+            add_other(entry)
 
     # Order: Breaking Changes, Features, Fixes, Other
-    for category in ["Breaking Changes", "Features", "Fixes", "Other"]:
-        if sections[category]:
-            lines.append(f"### {category}")
-            lines.append("")
-            lines.extend(sections[category])
-            lines.append("")
-
+    categories = (
+        ("### Breaking Changes", breaking),
+        ("### Features", features),
+        ("### Fixes", fixes),
+        ("### Other", other),
+    )
+    lines = itertools.chain(
+        [f"## [{version}] - {today}", ""],
+        *((heading, "", *items, "") for heading, items in categories if items),
+    )
+    if truncated:
+        lines = itertools.chain(
+            lines, [f"…and more commits (only the latest {len(commits)} are listed)", ""]
+        )
     return "\n".join(lines)
 
 
-def update_changelog(version: str, commits: list[dict[str, str]]) -> None:
-    """Update CHANGELOG.md with new version section."""
+def update_changelog(version: str, commits: Iterable[Commit], truncated: bool = False) -> bool:
+    """Update CHANGELOG.md with new version section.
+
+    ``truncated`` is passed through to generate_changelog_section.
+
+    Returns:
+        True if CHANGELOG.md was written, False if there was nothing to add
+    """
     print("\nGenerating changelog...")
+    commits = list(commits)
     print(f"  Found {len(commits)} commits since last tag")
+    if not commits:
+        print("  (no commits since last tag; skipping changelog update)")
+        return False
 
-    new_section = generate_changelog_section(version, commits)
+    new_section = generate_changelog_section(version, commits, truncated)
 
+    chunks: tuple[bytes | memoryview, ...]
     if CHANGELOG_FILE.exists():
-        content = CHANGELOG_FILE.read_text()
-        # Insert after the ## [Unreleased] section or at the top after header
-        unreleased_pattern = r"(## \[Unreleased\].*?\n)"
-        if re.search(unreleased_pattern, content):
-            new_content = re.sub(unreleased_pattern, rf"\1\n{new_section}\n", content)
+        content = CHANGELOG_FILE.read_bytes()
+        section = new_section.encode()
+        # Slices of a memoryview share the file's buffer instead of copying it
+        view = memoryview(content)
+        # Insert after the ## [Unreleased] heading line or at the top after header
+        idx = content.find(b"## [Unreleased]")
+        eol = content.find(b"\n", idx) + 1 if idx != -1 else 0
+        if eol:
+            chunks = (view[:eol], b"\n", section, b"\n", view[eol:])
         else:
-            # Find first ## section and insert before it
-            first_section = re.search(r"^## \[", content, re.MULTILINE)
-            if first_section:
-                pos = first_section.start()
-                new_content = content[:pos] + new_section + "\n" + content[pos:]
+            # Find first ## section (at a line start) and insert before it
+            if content.startswith(b"## ["):
+                pos = 0
+            else:
+                pos = content.find(b"\n## [")
+                if pos != -1:
+                    pos += 1
+            if pos != -1:
+                chunks = (view[:pos], section, b"\n", view[pos:])
             else:
-                new_content = content + "\n" + new_section
+                chunks = (view, b"\n", section)
     else:
         # Create new changelog
         new_content = f"""# Changelog
@@ -370,21 +628,20 @@ and this project uses [Calendar Versioning](https://calver.org/) (YYYY.MM.MICRO)
 
 {new_section}
 """
+        chunks = (new_content.encode(),)
 
-    CHANGELOG_FILE.write_text(new_content)
+    _write_atomic(CHANGELOG_FILE, *chunks)
     print("  ✓ CHANGELOG.md updated")
+    return True
 
 
-def get_last_tag() -> str | None:
-    """Get the most recent version tag."""
-    result = run_command(["git", "describe", "--tags", "--abbrev=0", "--match", "v*"], check=False)
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
-
-
+@functools.lru_cache(maxsize=1)
 def get_current_branch() -> str:
-    """Get the current git branch name."""
+    """Get the current git branch name.
+
+    Cached like get_current_version, so it reports the branch the run started
+    on even after prepare_release checks out the release branch.
+    """
     result = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
     return result.stdout.strip()
 
@@ -399,7 +656,8 @@ def verify_on_main() -> None:
 
 def verify_clean_working_directory() -> None:
     """Verify working directory has no uncommitted changes."""
-    result = run_command(["git", "status", "--porcelain"], check=False)
+    # Untracked files are never staged by the release, so skip walking them
+    result = run_command(["git", "status", "--porcelain=v2", "--untracked-files=no"], check=False)
     if result.stdout.strip():
         print("\nError: Working directory has uncommitted changes.")
         print("Please commit or stash them before releasing.")
@@ -408,29 +666,41 @@ def verify_clean_working_directory() -> None:
 
 def verify_gh_cli_available() -> None:
     """Verify GitHub CLI (gh) is installed and authenticated."""
-    result = run_command(["gh", "auth", "status"], check=False)
-    if result.returncode != 0:
+    if not _check_cmd(["gh", "auth", "status"]):
         print("Error: GitHub CLI (gh) is not installed or not authenticated.")
         print("Install it from https://cli.github.com/ and run 'gh auth login'")
         sys.exit(1)
 
 
-def branch_exists(branch_name: str) -> bool:
-    """Check if a local branch exists."""
-    result = run_command(["git", "rev-parse", "--verify", branch_name], check=False)
-    return result.returncode == 0
+def branch_exists_local_and_remote(branch_name: str) -> tuple[bool, bool]:
+    """Check whether a branch exists locally and on origin.
 
+    The remote side asks origin directly with ``git ls-remote`` for just this
+    branch, so no fetch is needed; it is started first and the local check
+    runs while it waits on the network.
 
-def remote_branch_exists(branch_name: str) -> bool:
-    """Check if a branch exists on remote origin."""
-    result = run_command(["git", "ls-remote", "--heads", "origin", branch_name], check=False)
-    return bool(result.stdout.strip())
+    Returns:
+        Tuple of (exists locally, exists on origin)
+    """
+    import subprocess
+
+    ref = f"refs/heads/{branch_name}"
+    with subprocess.Popen(
+        ["git", "ls-remote", "--heads", "origin", ref],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=_git_env(),
+    ) as remote:
+        local_exists = _check_cmd(["git", "rev-parse", "--verify", "--quiet", ref])
+        remote_out, _ = remote.communicate()
+    return local_exists, bool(remote_out.strip())
 
 
 def tag_exists(tag_name: str) -> bool:
     """Check if a tag exists."""
-    result = run_command(["git", "rev-parse", "--verify", f"refs/tags/{tag_name}"], check=False)
-    return result.returncode == 0
+    return _check_cmd(["git", "rev-parse", "--verify", "--quiet", f"refs/tags/{tag_name}"])
 
 
 def verify_version_in_files(expected_version: str) -> None:
@@ -448,10 +718,11 @@ def verify_version_in_files(expected_version: str) -> None:
 def verify_main_up_to_date() -> None:
     """Verify local main is up to date with origin/main."""
     print("\nFetching latest from origin...")
-    run_command(["git", "fetch", "origin"])
+    run_command(["git", "fetch", "origin"], capture=False)
 
-    local_head = run_command(["git", "rev-parse", "HEAD"]).stdout.strip()
-    remote_head = run_command(["git", "rev-parse", "origin/main"]).stdout.strip()
+    # Resolve both revisions with a single git invocation
+    heads = run_command(["git", "rev-parse", "HEAD", "origin/main"]).stdout.split()
+    local_head, remote_head = heads[0], heads[1]
 
     if local_head != remote_head:
         print("Error: Local 'main' is not up to date with 'origin/main'.")
@@ -492,8 +763,7 @@ def prepare_release(version: str, current_version: str, dry_run: bool) -> None:
     verify_clean_working_directory()
 
     # Check if branch already exists (locally or on remote)
-    local_exists = branch_exists(branch_name)
-    remote_exists = remote_branch_exists(branch_name)
+    local_exists, remote_exists = branch_exists_local_and_remote(branch_name)
     if local_exists or remote_exists:
         print(f"Error: Branch '{branch_name}' already exists.")
         if local_exists:
@@ -504,35 +774,31 @@ def prepare_release(version: str, current_version: str, dry_run: bool) -> None:
 
     # Create and checkout release branch
     print(f"\nCreating branch: {branch_name}")
-    run_command(["git", "checkout", "-b", branch_name])
+    run_command(["git", "checkout", "-b", branch_name], capture=False)
     print(f"  ✓ Created and checked out branch: {branch_name}")
 
     # Update version files
-    update_all_version_files(current_version, version)
+    files_to_add = update_all_version_files(current_version, version)
 
     # Get commits since last tag and generate changelog
-    last_tag = get_last_tag()
-    if last_tag:
-        commits = get_commits_since_tag(last_tag)
-    else:
-        commits = get_commits_since_tag("HEAD~50")  # Fallback: last 50 commits
+    _last_tag, commits, truncated = get_tag_and_commits()
 
-    update_changelog(version, commits)
+    changelog_updated = update_changelog(version, commits, truncated)
 
     # Stage and commit
     print("\nCommitting changes...")
-    files_to_add = VERSION_FILES + ["CHANGELOG.md"]
-    for filepath in files_to_add:
-        full_path = PROJECT_ROOT / filepath
-        if full_path.exists():
-            run_command(["git", "add", str(full_path)])
+    # Stage only what was written; no need to stat the files again
+    if changelog_updated:
+        files_to_add.append(CHANGELOG_FILE)
+    if files_to_add:
+        run_command(["git", "add", "--", *map(str, files_to_add)], capture=False)
 
-    run_command(["git", "commit", "-m", f"chore(release): {version}"])
+    run_command(["git", "commit", "-m", f"chore(release): {version}"], capture=False)
     print(f"  ✓ Committed: chore(release): {version}")
 
     # Push branch
     print("\nPushing branch...")
-    run_command(["git", "push", "-u", "origin", branch_name])
+    run_command(["git", "push", "-u", "origin", branch_name], capture=False)
     print(f"  ✓ Pushed branch: {branch_name}")
 
     # Create PR
@@ -561,7 +827,8 @@ This PR prepares the release of version {version}.
             pr_body,
             "--base",
             "main",
-        ]
+        ],
+        capture=False,
     )
     print(f"  ✓ Created PR for release {version}")
 
@@ -612,12 +879,12 @@ def tag_release(version: str, dry_run: bool) -> None:
 
     # Create annotated tag
     print(f"\nCreating tag: {tag_name}")
-    run_command(["git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"])
+    run_command(["git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"], capture=False)
     print(f"  ✓ Created tag: {tag_name}")
 
     # Push tag
     print("\nPushing tag...")
-    run_command(["git", "push", "origin", tag_name])
+    run_command(["git", "push", "origin", tag_name], capture=False)
     print(f"  ✓ Pushed tag: {tag_name}")
 
     print(f"\n✓ Tagged release {tag_name}")
@@ -625,14 +892,15 @@ def tag_release(version: str, dry_run: bool) -> None:
     print(f"\nNext step: python scripts/release.py --post-release --version {version}")
 
 
-def post_release(version: str, dry_run: bool) -> None:
+def post_release(version: str, dry_run: bool, parsed: CalVer | None = None) -> None:
     """Bump to dev version after a release by creating a PR.
 
     Args:
         version: The release version that was just tagged
         dry_run: If True, only show what would be done
+        parsed: CalVer from validate_calver, if available
     """
-    dev_version = calculate_dev_version(version)
+    dev_version = calculate_dev_version(version, parsed)
     branch_name = f"chore/bump-to-{dev_version}"
 
     if dry_run:
@@ -668,8 +936,7 @@ def post_release(version: str, dry_run: bool) -> None:
     print("  ✓ GitHub CLI is available")
 
     # Check if branch already exists (locally or on remote)
-    local_exists = branch_exists(branch_name)
-    remote_exists = remote_branch_exists(branch_name)
+    local_exists, remote_exists = branch_exists_local_and_remote(branch_name)
     if local_exists or remote_exists:
         print(f"Error: Branch '{branch_name}' already exists.")
         if local_exists:
@@ -680,25 +947,23 @@ def post_release(version: str, dry_run: bool) -> None:
 
     # Create and checkout branch
     print(f"\nCreating branch: {branch_name}")
-    run_command(["git", "checkout", "-b", branch_name])
+    run_command(["git", "checkout", "-b", branch_name], capture=False)
     print(f"  ✓ Created and checked out branch: {branch_name}")
 
     # Update version files to dev version
-    update_all_version_files(version, dev_version)
+    updated_files = update_all_version_files(version, dev_version)
 
     # Stage and commit
     print("\nCommitting dev version bump...")
-    for filepath in VERSION_FILES:
-        full_path = PROJECT_ROOT / filepath
-        if full_path.exists():
-            run_command(["git", "add", str(full_path)])
+    if updated_files:
+        run_command(["git", "add", "--", *map(str, updated_files)], capture=False)
 
-    run_command(["git", "commit", "-m", f"chore(release): bump to {dev_version}"])
+    run_command(["git", "commit", "-m", f"chore(release): bump to {dev_version}"], capture=False)
     print(f"  ✓ Committed: chore(release): bump to {dev_version}")
 
     # Push branch
     print("\nPushing branch...")
-    run_command(["git", "push", "-u", "origin", branch_name])
+    run_command(["git", "push", "-u", "origin", branch_name], capture=False)
     print(f"  ✓ Pushed branch: {branch_name}")
 
     # Create PR
@@ -720,7 +985,8 @@ This is an automated post-release version bump.
             pr_body,
             "--base",
             "main",
-        ]
+        ],
+        capture=False,
     )
     print(f"  ✓ Created PR for version bump to {dev_version}")
 
@@ -797,15 +1063,16 @@ With explicit version (recommended for --tag and --post-release):
     print(f"Current version: {current_version}")
 
     # Calculate target version based on action
+    parsed: CalVer | None = None
     if args.explicit_version:
-        version = validate_calver(args.explicit_version)
+        version, parsed = validate_calver(args.explicit_version)
     elif args.prepare:
         # --prepare: calculate next version (date-based)
         version = calculate_next_version(current_version, force_micro=args.micro)
     else:
         # --tag and --post-release: default to current version in files (stripped of .dev)
         version = strip_dev_suffix(current_version)
-        version = validate_calver(version)  # Normalize format
+        version, parsed = validate_calver(version)  # Normalize format
 
     print(f"Target version: {version}")
 
@@ -815,7 +1082,7 @@ With explicit version (recommended for --tag and --post-release):
     elif args.tag:
         tag_release(version, args.dry_run)
     elif args.post_release:
-        post_release(version, args.dry_run)
+        post_release(version, args.dry_run, parsed)
 
 
 if __name__ == "__main__":
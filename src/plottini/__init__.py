@@ -5,18 +5,59 @@ Plottini allows non-technical users to create publication-quality graphs
 from TSV data files with an intuitive UI and powerful configuration options.
 """
 
-__version__ = "2026.2.4.dev0"
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from plottini._version import __version__
+
 __author__ = "Lallu Anthoor"
 __email__ = "dev@spendly.co.in"
 __license__ = "MIT"
 
-# Core data handling
-from plottini.core.dataframe import Column, DataFrame, create_empty_dataframe
-from plottini.core.exporter import ExportConfig, Exporter, ExportFormat
-from plottini.core.parser import ParserConfig, TSVParser
+if TYPE_CHECKING:
+    # Core data handling
+    from plottini.core.dataframe import Column, DataFrame, create_empty_dataframe
+    from plottini.core.exporter import ExportConfig, Exporter, ExportFormat
+    from plottini.core.parser import ParserConfig, TSVParser
+
+    # Custom exceptions
+    from plottini.utils.errors import ExportError, ParseError, ValidationError
+
+# Public names re-exported lazily (PEP 562), mapped to their defining module.
+# Importing plottini (e.g. for `plottini version`) then doesn't load numpy,
+# matplotlib and the core modules until one of these is first accessed.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Column": "plottini.core.dataframe",
+    "DataFrame": "plottini.core.dataframe",
+    "create_empty_dataframe": "plottini.core.dataframe",
+    "ExportConfig": "plottini.core.exporter",
+    "Exporter": "plottini.core.exporter",
+    "ExportFormat": "plottini.core.exporter",
+    "ParserConfig": "plottini.core.parser",
+    "TSVParser": "plottini.core.parser",
+    "ExportError": "plottini.utils.errors",
+    "ParseError": "plottini.utils.errors",
+    "ValidationError": "plottini.utils.errors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily re-exported name on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily re-exported names in dir(plottini)."""
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
 
-# Custom exceptions
-from plottini.utils.errors import ExportError, ParseError, ValidationError
 
 __all__ = [
     # Metadata
@@ -0,0 +1,3 @@
+"""Package version, kept in a module with no imports of its own."""
+
+__version__ = "2026.2.4.dev0"
@@ -23,7 +23,7 @@ def cli(ctx: click.Context, port: int | None) -> None:
 @cli.command()
 def version() -> None:
     """Show version information."""
-    from plottini import __version__
+    from plottini._version import __version__
 
     click.echo(f"Plottini version {__version__}")
 
@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlignmentConfig:
     """Configuration for multi-file alignment.
 
@@ -21,7 +21,7 @@ class AlignmentConfig:
     column: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DerivedColumnConfig:
     """Configuration for a derived column.
 
@@ -34,7 +34,7 @@ class DerivedColumnConfig:
     expression: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterConfig:
     """Configuration for row filtering.
 
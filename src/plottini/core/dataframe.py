@@ -58,10 +58,12 @@ class DataFrame:
     def __post_init__(self) -> None:
         """Initialize column order if not provided."""
         if not self._column_order and self.columns:
-            # Sort by column index to maintain original order
-            self._column_order = sorted(
-                self.columns.keys(), key=lambda name: self.columns[name].index
-            )
+            names = list(self.columns)
+            indices = [col.index for col in self.columns.values()]
+            # Columns are normally inserted in index order; only sort if not
+            if any(a > b for a, b in zip(indices, indices[1:], strict=False)):
+                names.sort(key=lambda name: self.columns[name].index)
+            self._column_order = names
 
     def get_column_names(self) -> list[str]:
         """Return ordered list of column names.
@@ -135,7 +137,7 @@ class DataFrame:
         from plottini.core.transforms import evaluate_expression
 
         # Build columns dict for expression evaluation
-        column_data = {col_name: self[col_name] for col_name in self.columns}
+        column_data = {col_name: col.data for col_name, col in self.columns.items()}
 
         # Evaluate expression
         result = evaluate_expression(expression, column_data)
@@ -184,25 +186,53 @@ class DataFrame:
         Returns:
             New DataFrame with filtered rows.
 
+        Raises:
+            KeyError: If column doesn't exist.
+        """
+        return self._apply_mask(self._range_mask(column, min_val, max_val))
+
+    def _range_mask(
+        self,
+        column: str,
+        min_val: float | None,
+        max_val: float | None,
+    ) -> NDArray[np.bool_]:
+        """Build the boolean row mask for filter_rows.
+
         Raises:
             KeyError: If column doesn't exist.
         """
         # Get column data (raises KeyError if column doesn't exist)
         col_data = self[column]
 
-        # Build boolean mask
-        mask = np.ones(len(col_data), dtype=bool)
-        if min_val is not None:
-            mask &= col_data >= min_val
-        if max_val is not None:
-            mask &= col_data <= max_val
+        # One comparison pass per bound, without an all-True starting mask
+        if min_val is None:
+            if max_val is None:
+                return np.ones(len(col_data), dtype=bool)
+            return col_data <= max_val
+        if max_val is None:
+            return col_data >= min_val
+        return (col_data >= min_val) & (col_data <= max_val)
+
+    def _apply_mask(self, mask: NDArray[np.bool_]) -> DataFrame:
+        """Return a new DataFrame with only the rows selected by a boolean mask.
+
+        Raises:
+            ValueError: If the mask does not have one entry per row.
+        """
+        # take() would silently accept a short mask, so check it up front
+        if mask.shape != (self.row_count,):
+            raise ValueError(f"Mask shape {mask.shape} does not match row count {self.row_count}")
+
+        # Resolve the mask to row indices once rather than once per column
+        rows = np.flatnonzero(mask)
 
         # Create new filtered columns
         new_columns = {
             name: Column(
                 name=col.name,
                 index=col.index,
-                data=col.data[mask],
+                data=col.data.take(rows),
                 is_derived=col.is_derived,
             )
             for name, col in self.columns.items()
@@ -211,7 +241,7 @@ class DataFrame:
         return DataFrame(
             columns=new_columns,
             source_file=self.source_file,
-            row_count=int(np.sum(mask)),
+            row_count=len(rows),
             _column_order=self._column_order.copy(),
             block_index=self.block_index,
         )
@@ -295,10 +325,10 @@ def align_dataframes(
     if any(values.size == 0 for values in align_values_per_df):
         raise ValueError("Cannot align empty DataFrames")
 
-    # Compute union range (min and max across all DataFrames)
-    all_values = np.concatenate(align_values_per_df)
-    x_min = float(np.min(all_values))
-    x_max = float(np.max(all_values))
+    # Compute union range from per-DataFrame extremes, without concatenating
+    # the columns. Reducing with np.min/np.max keeps NaN propagation.
+    x_min = float(np.min([np.min(values) for values in align_values_per_df]))
+    x_max = float(np.max([np.max(values) for values in align_values_per_df]))
 
     return AlignedDataFrames(
         dataframes=dataframes,
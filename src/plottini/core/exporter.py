@@ -45,12 +45,11 @@ class ExportFormat(Enum):
         Raises:
             ValueError: If value is not a valid format.
         """
-        value_lower = value.lower()
-        for fmt in cls:
-            if fmt.value == value_lower:
-                return fmt
-        valid = ", ".join(f.value for f in cls)
-        raise ValueError(f"Invalid export format: '{value}'. Valid formats: {valid}")
+        try:
+            return cls(value.lower())
+        except ValueError:
+            valid = ", ".join(f.value for f in cls)
+            raise ValueError(f"Invalid export format: '{value}'. Valid formats: {valid}") from None
 
 
 @dataclass
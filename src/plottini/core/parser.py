@@ -7,12 +7,14 @@ with support for headers, comments, and scientific notation.
 from __future__ import annotations
 
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import IO
 
 import numpy as np
+from numpy.typing import NDArray
 
 from plottini.core.dataframe import Column, DataFrame, create_empty_dataframe
 from plottini.utils.errors import ParseError
@@ -20,6 +22,9 @@ from plottini.utils.errors import ParseError
 # Type alias for file-like objects or paths
 FileSource = Path | str | IO[bytes]
 
+# Upper bound on worker threads used by TSVParser.parse_multiple
+MAX_PARSE_WORKERS = 8
+
 
 @dataclass
 class ParserConfig:
@@ -78,6 +83,24 @@ class TSVParser:
             FileNotFoundError: If file path does not exist.
             ParseError: If file contains invalid data.
         """
+        df, warning = self._parse_source(source, source_name)
+        if warning is not None:
+            warnings.warn(warning, stacklevel=2)
+        return df
+
+    def _parse_source(
+        self,
+        source: FileSource,
+        source_name: str | None = None,
+    ) -> tuple[DataFrame, str | None]:
+        """Parse a source without emitting warnings.
+
+        Warnings are returned instead, so that parse_multiple can run this in
+        worker threads and still warn from the calling thread, in input order.
+
+        Returns:
+            The parsed DataFrame and a warning message, or None.
+        """
         # Determine if source is a path or file-like object
         if isinstance(source, (Path, str)):
             path = Path(source)
@@ -93,11 +116,10 @@ class TSVParser:
         data_lines = self._filter_lines(lines)
 
         if not data_lines:
-            warnings.warn(
+            return (
+                create_empty_dataframe(display_path),
                 f"File '{display_path}' is empty or contains only comments",
-                stacklevel=2,
             )
-            return create_empty_dataframe(display_path)
 
         # Extract headers or generate column names
         if self.config.has_header:
@@ -126,44 +148,13 @@ class TSVParser:
 
         if not data_lines:
             # File had header only, no data
-            warnings.warn(
+            return (
+                create_empty_dataframe(display_path),
                 f"File '{display_path}' contains only a header row with no data",
-                stacklevel=2,
             )
-            return create_empty_dataframe(display_path)
 
         # Parse data rows
-        num_cols = len(column_names)
-        data_arrays: list[list[float]] = [[] for _ in range(num_cols)]
-
-        for line, line_num in data_lines:
-            values = self._split_line(line)
-            values = [v.strip() for v in values]
-
-            # Validate column count
-            if len(values) != num_cols:
-                raise ParseError(
-                    file_path=display_path,
-                    line_number=line_num,
-                    message=f"Inconsistent column count: expected {num_cols}, got {len(values)}",
-                    context_line=line,
-                )
-
-            # Parse each value
-            for col_idx, value in enumerate(values):
-                try:
-                    numeric_value = float(value)
-                except ValueError:
-                    raise ParseError(
-                        file_path=display_path,
-                        line_number=line_num,
-                        column=col_idx + 1,
-                        message="Invalid numeric value",
-                        raw_value=value,
-                        context_line=line,
-                    ) from None
-
-                data_arrays[col_idx].append(numeric_value)
+        matrix = self._parse_rows(display_path, data_lines, len(column_names))
 
         # Build DataFrame
         columns: dict[str, Column] = {}
@@ -171,30 +162,52 @@ class TSVParser:
             columns[name] = Column(
                 name=name,
                 index=idx,
-                data=np.array(data_arrays[idx], dtype=np.float64),
+                data=matrix[:, idx],
             )
 
         return DataFrame(
             columns=columns,
             source_file=display_path,
-            row_count=len(data_arrays[0]),
+            row_count=len(matrix),
             _column_order=column_names,
-        )
+        ), None
 
     def parse_multiple(self, file_paths: Sequence[Path | str]) -> list[DataFrame]:
         """Parse multiple TSV files.
 
+        Files are read and parsed concurrently, so one file's disk reads
+        overlap with another's parsing. Warnings for empty files are emitted
+        from the calling thread, in the order of ``file_paths``.
+
         Args:
             file_paths: List of paths to TSV files.
 
         Returns:
-            List of DataFrames, one per file.
+            List of DataFrames, one per file, in the order of ``file_paths``.
 
         Raises:
             FileNotFoundError: If any file does not exist.
             ParseError: If any file contains invalid data.
         """
-        return [self.parse(path) for path in file_paths]
+        if len(file_paths) < 2:
+            return self._collect_results(map(self._parse_source, file_paths))
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(file_paths))) as executor:
+            return self._collect_results(executor.map(self._parse_source, file_paths))
+
+    def _collect_results(self, results: Iterator[tuple[DataFrame, str | None]]) -> list[DataFrame]:
+        """Gather parse results in order, warning for each one that has a warning.
+
+        Must be called directly from parse_multiple so the warnings point at
+        its caller. A failing file's exception is raised when its result is
+        reached, after the warnings of the files before it.
+        """
+        dataframes: list[DataFrame] = []
+        for df, warning in results:
+            if warning is not None:
+                warnings.warn(warning, stacklevel=3)
+            dataframes.append(df)
+        return dataframes
 
     def parse_blocks(
         self,
@@ -266,12 +279,13 @@ class TSVParser:
         """
         blocks: list[list[tuple[str, int]]] = []
         current_block: list[tuple[str, int]] = []
+        comment_prefixes = tuple(self.config.comment_chars)
 
         for line_num, line in enumerate(lines, start=1):
             stripped = line.strip()
 
             # Empty line or comment line marks end of current block
-            if not stripped or any(stripped.startswith(char) for char in self.config.comment_chars):
+            if not stripped or stripped.startswith(comment_prefixes):
                 if current_block:
                     blocks.append(current_block)
                     current_block = []
@@ -329,12 +343,72 @@ class TSVParser:
             return create_empty_dataframe(path)
 
         # Parse data rows
-        num_cols = len(column_names)
-        data_arrays: list[list[float]] = [[] for _ in range(num_cols)]
+        matrix = self._parse_rows(path, data_lines, len(column_names))
+
+        # Build DataFrame
+        columns: dict[str, Column] = {}
+        for idx, name in enumerate(column_names):
+            columns[name] = Column(
+                name=name,
+                index=idx,
+                data=matrix[:, idx],
+            )
+
+        return DataFrame(
+            columns=columns,
+            source_file=path,
+            row_count=len(matrix),
+            _column_order=column_names,
+            block_index=block_idx,
+        )
+
+    def _parse_rows(
+        self, path: Path, data_lines: list[tuple[str, int]], num_cols: int
+    ) -> NDArray[np.float64]:
+        """Convert data lines into a column-major array of shape (rows, num_cols).
+
+        The lines are handed to numpy's C tokenizer in one call. If that
+        fails, or yields the wrong column count, the lines are re-parsed
+        value by value with ``float()`` so that the ParseError points at
+        the offending line and column.
+
+        The array is Fortran-ordered, so each ``matrix[:, i]`` is a
+        contiguous zero-copy view and all columns of a block share one
+        allocation.
+
+        Args:
+            path: Source file path (for error messages).
+            data_lines: Data lines as (content, line_number) tuples.
+            num_cols: Expected number of columns.
 
+        Returns:
+            Array with one row per data line.
+
+        Raises:
+            ParseError: If a line has the wrong column count or a value
+                is not numeric.
+        """
+        # np.loadtxt only takes single-character delimiters; anything longer
+        # goes straight to the float() loop below
+        delimiter = self.config.delimiter
+        if delimiter == " " or len(delimiter) == 1:
+            try:
+                matrix = np.loadtxt(
+                    [line for line, _ in data_lines],
+                    delimiter=None if delimiter == " " else delimiter,
+                    comments=None,
+                    dtype=np.float64,
+                    ndmin=2,
+                )
+            except ValueError:
+                pass
+            else:
+                if matrix.shape[1] == num_cols:
+                    return np.asfortranarray(matrix)
+
+        rows: list[list[float]] = []
         for line, line_num in data_lines:
             values = self._split_line(line)
-            values = [v.strip() for v in values]
 
             # Validate column count
             if len(values) != num_cols:
@@ -345,38 +419,24 @@ class TSVParser:
                     context_line=line,
                 )
 
-            # Parse each value
+            # Parse each value; float() ignores surrounding whitespace, so
+            # fields are only stripped when reporting an error
+            row: list[float] = []
             for col_idx, value in enumerate(values):
                 try:
-                    numeric_value = float(value)
+                    row.append(float(value))
                 except ValueError:
                     raise ParseError(
                         file_path=path,
                         line_number=line_num,
                         column=col_idx + 1,
                         message="Invalid numeric value",
-                        raw_value=value,
+                        raw_value=value.strip(),
                         context_line=line,
                     ) from None
+            rows.append(row)
 
-                data_arrays[col_idx].append(numeric_value)
-
-        # Build DataFrame
-        columns: dict[str, Column] = {}
-        for idx, name in enumerate(column_names):
-            columns[name] = Column(
-                name=name,
-                index=idx,
-                data=np.array(data_arrays[idx], dtype=np.float64),
-            )
-
-        return DataFrame(
-            columns=columns,
-            source_file=path,
-            row_count=len(data_arrays[0]),
-            _column_order=column_names,
-            block_index=block_idx,
-        )
+        return np.array(rows, dtype=np.float64, order="F")
 
     def _split_line(self, line: str) -> list[str]:
         """Split a line by the configured delimiter.
@@ -430,6 +490,8 @@ class TSVParser:
         Line numbers are 1-based.
         """
         result: list[tuple[str, int]] = []
+        # str.startswith takes a tuple, checking all prefixes in one C call
+        comment_prefixes = tuple(self.config.comment_chars)
 
         for line_num, line in enumerate(lines, start=1):
             stripped = line.strip()
@@ -439,7 +501,7 @@ class TSVParser:
                 continue
 
             # Skip comment lines
-            if any(stripped.startswith(char) for char in self.config.comment_chars):
+            if stripped.startswith(comment_prefixes):
                 continue
 
             result.append((stripped, line_num))
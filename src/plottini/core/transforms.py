@@ -7,6 +7,7 @@ for derived columns.
 from __future__ import annotations
 
 import ast
+import functools
 import operator
 from enum import Enum
 from typing import Any
@@ -202,11 +203,28 @@ def validate_expression(expression: str) -> bool:
     Returns:
         True if expression is safe, False otherwise.
     """
+    return _parse_expression(expression) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_expression(expression: str) -> ast.Expression | None:
+    """Parse and validate an expression, caching the result per string.
+
+    The same expression is typically evaluated against many data blocks,
+    so the AST is built and checked once and reused. The returned tree
+    must not be mutated.
+
+    Args:
+        expression: Mathematical expression to parse.
+
+    Returns:
+        The validated AST, or None if the expression is invalid or unsafe.
+    """
     try:
         tree = ast.parse(expression, mode="eval")
-        return _validate_node(tree)
     except SyntaxError:
-        return False
+        return None
+    return tree if _validate_node(tree) else None
 
 
 def _validate_node(node: ast.AST) -> bool:
@@ -276,7 +294,8 @@ def evaluate_expression(
         ExpressionError: If expression is invalid or evaluation fails.
     """
     # Validate expression first
-    if not validate_expression(expression):
+    tree = _parse_expression(expression)
+    if tree is None:
         raise ExpressionError(
             message="Invalid or unsafe expression",
             expression=expression,
@@ -284,7 +303,6 @@ def evaluate_expression(
         )
 
     try:
-        tree = ast.parse(expression, mode="eval")
         result = _evaluate_node(tree.body, columns)
 
         # Validate result for invalid values
@@ -10,6 +10,9 @@ import time
 import urllib.request
 from pathlib import Path
 
+# Streamlit entry point, resolved once at import
+_APP_PATH = str(Path(__file__).parent / "ui" / "app.py")
+
 
 def find_free_port() -> int:
     """Find an available port.
@@ -23,25 +26,30 @@ def find_free_port() -> int:
         return port
 
 
-def _wait_for_server(url: str, max_retries: int = 5) -> bool:
-    """Wait for server to be ready with exponential backoff.
+def _wait_for_server(url: str, timeout: float = 15.0, interval: float = 0.1) -> bool:
+    """Wait for server to be ready, polling at a short fixed interval.
+
+    A short interval lets the window open as soon as Streamlit starts
+    answering, instead of up to several seconds later as with exponential
+    backoff.
 
     Args:
         url: URL to poll
-        max_retries: Maximum number of retry attempts
+        timeout: Maximum time to wait in seconds
+        interval: Delay between attempts in seconds
 
     Returns:
         True if server is ready, False if timed out
     """
-    delay = 0.5  # Initial delay in seconds
-    for _ in range(max_retries):
+    deadline = time.monotonic() + timeout
+    while True:
         try:
             urllib.request.urlopen(url, timeout=1)
             return True
         except Exception:
-            time.sleep(delay)
-            delay *= 2  # Double the delay for next attempt
-    return False
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
 
 
 def start_desktop(port: int | None = None) -> None:
@@ -68,7 +76,7 @@ def start_desktop(port: int | None = None) -> None:
                     "-m",
                     "streamlit",
                     "run",
-                    str(Path(__file__).parent / "ui" / "app.py"),
+                    _APP_PATH,
                     "--server.port",
                     str(port),
                     "--server.headless",
@@ -101,7 +109,7 @@ def start_desktop(port: int | None = None) -> None:
     thread = threading.Thread(target=run_streamlit, daemon=True)
     thread.start()
 
-    # Wait for Streamlit to be ready with exponential backoff
+    # Poll until Streamlit answers or the startup timeout passes
     if not _wait_for_server(url):
         print("Error: Failed to start Streamlit server", file=sys.stderr)
         sys.exit(1)
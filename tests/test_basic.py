@@ -1,5 +1,10 @@
 """Basic tests for plottini package."""
 
+import subprocess
+import sys
+
+import pytest
+
 import plottini
 
 
@@ -16,3 +21,27 @@ def test_license():
 def test_author():
     """Test that author is set."""
     assert plottini.__author__ == "Lallu Anthoor"
+
+
+def test_lazy_exports():
+    """Test that re-exported names resolve to their defining modules."""
+    from plottini.core.parser import TSVParser
+    from plottini.utils.errors import ParseError
+
+    assert plottini.TSVParser is TSVParser
+    assert plottini.ParseError is ParseError
+    for name in plottini.__all__:
+        assert hasattr(plottini, name)
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        plottini.does_not_exist  # noqa: B018
+
+
+def test_import_does_not_load_core():
+    """Test that importing the package defers loading the core modules."""
+    code = "import sys, plottini; print('plottini.core.parser' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
@@ -162,6 +162,18 @@ class TestDataFrame:
 
         assert filtered.source_file == sample_dataframe.source_file
 
+    def test_filter_rows_without_bounds_keeps_all_rows(self, sample_dataframe: DataFrame) -> None:
+        """Test that filtering with no bounds keeps every row."""
+        filtered = sample_dataframe.filter_rows("DOS")
+
+        assert len(filtered) == len(sample_dataframe)
+        np.testing.assert_array_equal(filtered["DOS"], sample_dataframe["DOS"])
+
+    def test_apply_mask_wrong_length_raises_valueerror(self, sample_dataframe: DataFrame) -> None:
+        """Test that a mask with the wrong number of rows is rejected."""
+        with pytest.raises(ValueError, match="row count 3"):
+            sample_dataframe._apply_mask(np.array([True, False]))
+
 
 class TestFilterRowsWithDerivedColumns:
     """Tests for filter_rows with derived columns."""
@@ -323,6 +335,20 @@ class TestDataFrameColumnOrder:
         # Column order should be by index, not by insertion order
         assert df.get_column_names() == ["A", "B", "C"]
 
+    def test_column_order_partially_out_of_order(self) -> None:
+        """Test that a single out-of-order column is still sorted by index."""
+        col_a = Column(name="A", index=0, data=np.array([1.0], dtype=np.float64))
+        col_c = Column(name="C", index=2, data=np.array([1.0], dtype=np.float64))
+        col_b = Column(name="B", index=1, data=np.array([1.0], dtype=np.float64))
+
+        df = DataFrame(
+            columns={"A": col_a, "C": col_c, "B": col_b},
+            source_file=Path("test.tsv"),
+            row_count=1,
+        )
+
+        assert df.get_column_names() == ["A", "B", "C"]
+
     def test_explicit_column_order(self) -> None:
         """Test explicitly providing column order."""
         col1 = Column(name="X", index=0, data=np.array([1.0], dtype=np.float64))
@@ -531,3 +557,23 @@ class TestAlignDataFrames:
         # Should span the full union range
         assert result.x_min == 0.0
         assert result.x_max == 12.0
+
+    def test_align_dataframes_nan_propagates_to_range(self) -> None:
+        """Test that NaN in any alignment column yields a NaN range, as before."""
+        from plottini.core.dataframe import align_dataframes
+
+        df1 = DataFrame(
+            columns={"x": Column(name="x", index=0, data=np.array([0.0, 1.0]))},
+            source_file=Path("a.tsv"),
+            row_count=2,
+        )
+        df2 = DataFrame(
+            columns={"x": Column(name="x", index=0, data=np.array([2.0, np.nan]))},
+            source_file=Path("b.tsv"),
+            row_count=2,
+        )
+
+        result = align_dataframes([df1, df2], "x")
+
+        assert np.isnan(result.x_min)
+        assert np.isnan(result.x_max)
@@ -2,7 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
-from plottini.desktop import find_free_port
+from plottini.desktop import _wait_for_server, find_free_port
 
 
 class TestFindFreePort:
@@ -31,6 +31,33 @@ class TestFindFreePort:
             s.bind(("127.0.0.1", port))
 
 
+class TestWaitForServer:
+    """Tests for _wait_for_server function."""
+
+    def test_returns_true_once_server_answers(self) -> None:
+        """Test that polling stops as soon as the server responds."""
+        with (
+            patch(
+                "plottini.desktop.urllib.request.urlopen",
+                side_effect=[OSError, OSError, MagicMock()],
+            ) as mock_urlopen,
+            patch("plottini.desktop.time.sleep") as mock_sleep,
+        ):
+            assert _wait_for_server("http://localhost:1", timeout=5.0, interval=0.1)
+
+        assert mock_urlopen.call_count == 3
+        mock_sleep.assert_called_with(0.1)
+
+    def test_returns_false_after_timeout(self) -> None:
+        """Test that polling gives up once the timeout has elapsed."""
+        with (
+            patch("plottini.desktop.urllib.request.urlopen", side_effect=OSError),
+            patch("plottini.desktop.time.sleep"),
+            patch("plottini.desktop.time.monotonic", side_effect=[0.0, 1.0, 2.0, 3.5]),
+        ):
+            assert not _wait_for_server("http://localhost:1", timeout=3.0)
+
+
 class TestStartDesktop:
     """Tests for start_desktop function (mocked)."""
 
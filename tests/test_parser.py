@@ -156,6 +156,53 @@ class TestTSVParser:
         assert dataframes[0].source_file == paths[0]
         assert dataframes[1].source_file == paths[1]
 
+    def test_parse_multiple_preserves_order(self, tmp_path: Path) -> None:
+        """Test that results follow input order when files are parsed concurrently."""
+        paths = []
+        for i in range(12):
+            file = tmp_path / f"file_{i}.tsv"
+            file.write_text("x\ty\n" + "".join(f"{j}\t{i}\n" for j in range(50 * (12 - i))))
+            paths.append(file)
+
+        dataframes = TSVParser().parse_multiple(paths)
+
+        assert [df.source_file for df in dataframes] == paths
+        for i, df in enumerate(dataframes):
+            assert df["y"][0] == i
+            assert df.row_count == 50 * (12 - i)
+
+    def test_parse_multiple_raises_parse_error(self) -> None:
+        """Test that a malformed file among several raises ParseError."""
+        paths = [
+            FIXTURES_DIR / "with_headers.tsv",
+            FIXTURES_DIR / "malformed" / "non_numeric.tsv",
+            FIXTURES_DIR / "with_comments.tsv",
+        ]
+
+        with pytest.raises(ParseError) as exc_info:
+            TSVParser().parse_multiple(paths)
+
+        assert exc_info.value.file_path == paths[1]
+
+    def test_parse_multiple_warns_in_order_at_caller(self, tmp_path: Path) -> None:
+        """Test that warnings from parse_multiple keep file order and point at the caller."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"empty_{i}.tsv"
+            path.write_text("# comments only\n" if i % 2 else "x\ty\n")
+            paths.append(path)
+
+        with pytest.warns(UserWarning) as record:
+            TSVParser().parse_multiple(paths)
+
+        assert [str(w.message) for w in record] == [
+            f"File '{path}' contains only a header row with no data"
+            if i % 2 == 0
+            else f"File '{path}' is empty or contains only comments"
+            for i, path in enumerate(paths)
+        ]
+        assert all(w.filename == __file__ for w in record)
+
     def test_parse_string_path(self) -> None:
         """Test that string paths work as well as Path objects."""
         parser = TSVParser()
@@ -471,6 +518,71 @@ class TestParserEdgeCasesAdditional:
         assert df["x"][0] == 1.0e-308
         assert df["y"][0] == -1.0e-308
 
+    def test_python_float_syntax_accepted(self, tmp_path: Path) -> None:
+        """Test that values float() accepts but numpy's tokenizer rejects still parse."""
+        file = tmp_path / "underscores.tsv"
+        file.write_text("x\ty\n1_000\t2.5\n3.0\t4_0\n")
+
+        parser = TSVParser()
+        df = parser.parse(file)
+
+        assert df["x"].tolist() == [1000.0, 3.0]
+        assert df["y"].tolist() == [2.5, 40.0]
+
+    def test_multi_character_delimiter(self, tmp_path: Path) -> None:
+        """Test parsing with a delimiter longer than one character."""
+        file = tmp_path / "double_colon.txt"
+        file.write_text("x::y\n1::2\n3.5::-4\n")
+
+        parser = TSVParser(ParserConfig(delimiter="::"))
+        df = parser.parse(file)
+        blocks = parser.parse_blocks(file)
+
+        assert df.get_column_names() == ["x", "y"]
+        assert df["x"].tolist() == [1.0, 3.5]
+        assert df["y"].tolist() == [2.0, -4.0]
+        assert len(blocks) == 1
+        assert blocks[0]["y"].tolist() == [2.0, -4.0]
+
+    def test_invalid_value_reported_without_padding(self, tmp_path: Path) -> None:
+        """Test that whitespace around an invalid value is not part of raw_value."""
+        file = tmp_path / "padded.tsv"
+        file.write_text("x\ty\n1.0\t  abc  \t\n")
+
+        parser = TSVParser()
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse(file)
+
+        assert exc_info.value.column == 2
+        assert exc_info.value.raw_value == "abc"
+
+    def test_columns_are_contiguous_views_of_one_block(self, tmp_path: Path) -> None:
+        """Test that parsed columns are contiguous and share one allocation."""
+        file = tmp_path / "shared.tsv"
+        file.write_text("x\ty\tz\n1.0\t2.0\t3.0\n4.0\t5.0\t6.0\n")
+
+        parser = TSVParser()
+        df = parser.parse(file)
+
+        for name in df.get_column_names():
+            assert df[name].flags["C_CONTIGUOUS"]
+        assert np.shares_memory(df["x"].base, df["z"])
+        assert df["z"].tolist() == [3.0, 6.0]
+
+    def test_invalid_value_error_location_in_later_row(self, tmp_path: Path) -> None:
+        """Test that a bad value deep in the data is reported at its line and column."""
+        rows = "".join(f"{i}\t{i * 2}\n" for i in range(100))
+        file = tmp_path / "bad_late.tsv"
+        file.write_text("x\ty\n" + rows + "100\tabc\n")
+
+        parser = TSVParser()
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse(file)
+
+        assert exc_info.value.line_number == 102
+        assert exc_info.value.column == 2
+        assert exc_info.value.raw_value == "abc"
+
 
 class TestParseBlocksEdgeCases:
     """Edge cases for multi-block parsing."""
@@ -361,6 +361,13 @@ class TestEvaluateExpressionArithmetic:
         expected = np.array([3.0, 5.0, 7.0])
         assert_array_almost_equal(result, expected)
 
+    def test_same_expression_on_different_columns(self):
+        """Test that reusing an expression evaluates against the new columns."""
+        first = evaluate_expression("col1 * 2", {"col1": np.array([1.0, 2.0])})
+        second = evaluate_expression("col1 * 2", {"col1": np.array([5.0, 6.0, 7.0])})
+        assert_array_almost_equal(first, np.array([2.0, 4.0]))
+        assert_array_almost_equal(second, np.array([10.0, 12.0, 14.0]))
+
 
 class TestEvaluateExpressionFunctions:
     """Tests for function calls in evaluate_expression."""